@@ -4,27 +4,67 @@ The methods exposed through this module are intended to be called through approp
 be used directly.
 """
 
-import configparser
+import functools
 import os
 import re
 import shutil
-import subprocess
 import sys
+import threading
 from os import PathLike
-from typing import AnyStr, Optional
+from typing import AnyStr, Callable, Iterator, Optional, Sequence, cast
 
 import click
 import yaml
 
+# Prefers the libyaml C bindings, which parse and emit YAML orders of magnitude faster than the pure-Python
+# implementations. Falls back to the pure-Python classes when pyyaml was built without libyaml.
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from .utilities import format_message
 
+# Matches .pyi stub file names, capturing the base name and the optional 'copy number' appended (with a space) by
+# OSX when multiple copies of the same stub file end up in the same directory.
+_PYI_DUP_PATTERN: re.Pattern[str] = re.compile(r"^(.*?)(?: (\d+))?\.pyi$")
+
+# Matches the top-level 'name' field of conda environment .yml files. Used to rewrite the environment name in-place,
+# without round-tripping the whole (potentially very large) dependency list through the YAML parser.
+_YML_NAME_PATTERN: re.Pattern[str] = re.compile(r"^name:\s*\S+", re.MULTILINE)
+
+# Patterns used to verify '.pypirc' files against the minimal schema written by set_pypi_token, without paying for a
+# full configparser tokenization pass. The split pattern separates the file into ini sections, the other two verify
+# the authentication options inside the '[pypi]' section.
+_INI_SECTION_SPLIT: re.Pattern[str] = re.compile(r"^\[", re.MULTILINE)
+_PYPIRC_USERNAME_PATTERN: re.Pattern[str] = re.compile(r"^\s*username\s*=\s*__token__\s*$", re.MULTILINE)
+_PYPIRC_PASSWORD_PATTERN: re.Pattern[str] = re.compile(r"^\s*password\s*=\s*pypi-", re.MULTILINE)
+
+# Precompiled patterns used by the click prompt validators below. Compiling once at import avoids re-entering the
+# regex-cache lookup machinery on every prompt attempt. Library and environment names share the same rules, so they
+# also share a single compiled pattern, which is a bare character class applied via fullmatch() to avoid the anchor
+# bookkeeping of an explicit '^...$' pattern.
+_NAME_PATTERN: re.Pattern[str] = re.compile(r"[a-zA-Z0-9_]*")
+_PROJECT_NAME_PATTERN: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9-]+$")
+_EMAIL_PATTERN: re.Pattern[str] = re.compile(r"^[\w.-]+@[\w.-]+\.\w+$")
+
+# The host OS cannot change for the lifetime of the process, so the platform-specific environment postfix is
+# resolved once at import time instead of rebuilding the dispatch dictionary on every call. A None value means the
+# host OS is not supported, which is reported when the constant is first used.
+_PLATFORM_SUFFIX: Optional[str] = {"win32": "_win", "linux": "_lin", "darwin": "_osx"}.get(sys.platform)
+
 
+@functools.lru_cache(maxsize=1)
 def resolve_project_directory() -> str:
     """This utility function gets the current working directory from the OS and verifies that it points to a valid
     python project.
 
     This function was introduced when automation moved to a separate package to decouple the behavior of this module's
-    functions from the location of the module.
+    functions from the location of the module. The working directory cannot change for the duration of a CLI
+    invocation, so the resolved (and verified) path is cached after the first call and helper functions that re-invoke
+    this function do not pay for repeated filesystem probes.
 
     Returns:
         The absolute path to the project root directory.
@@ -33,18 +73,20 @@ def resolve_project_directory() -> str:
         RuntimeError: If the current working directory does not point to a valid Python project.
     """
     project_dir: str = os.getcwd()
-    files_in_dir: list[str] = os.listdir(project_dir)
-    if (
-        "src" not in files_in_dir
-        or "envs" not in files_in_dir
-        or "pyproject.toml" not in files_in_dir
-        or "tox.ini" not in files_in_dir
-    ):
+
+    # Probes the required entries with individual existence checks instead of enumerating the whole project root
+    # directory, which avoids listing potentially hundreds of unrelated entries to locate the four that matter.
+    required_entries: tuple[str, ...] = ("src", "envs", "pyproject.toml", "tox.ini")
+    missing_entries: list[str] = [
+        name for name in required_entries if not os.path.lexists(os.path.join(project_dir, name))
+    ]
+    if missing_entries:
         message: str = format_message(
             f"Unable to confirm that automation module has been called from the root directory of a valid Python "
-            f"project. This module is hardcoded to work with SunLab project organization template and is likely to "
-            f"not work as intended for other projects. Additionally, it assumes the current working directory is set "
-            f"to the root directory of the project. 'cd' into the root directory of the project and try again."
+            f"project. The following expected entries are missing: {', '.join(missing_entries)}. This module is "
+            f"hardcoded to work with SunLab project organization template and is likely to not work as intended for "
+            f"other projects. Additionally, it assumes the current working directory is set to the root directory of "
+            f"the project. 'cd' into the root directory of the project and try again."
         )
         click.echo(message, err=True)
         raise click.Abort()
@@ -52,6 +94,73 @@ def resolve_project_directory() -> str:
         return project_dir
 
 
+def _scandir_recursive(path: str, file_name: str) -> "Iterator[str]":
+    """Recursively crawls the input directory tree and yields the paths to all files with the matching name.
+
+    This traversal intentionally uses os.scandir instead of pathlib globbing, as scandir caches the file metadata
+    obtained during directory enumeration. This avoids issuing a redundant stat() call for every evaluated entry and
+    building a Path object for every non-matching file.
+
+    Args:
+        path: The path to the root level of the directory to crawl.
+        file_name: The name of the file(s) to look for during the crawl.
+
+    Yields:
+        The absolute paths to all discovered files with the matching name.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Symlinks are skipped to avoid escaping the crawled directory tree.
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path, file_name)
+            elif entry.name == file_name:
+                yield entry.path
+
+
+def _scandir_recursive_suffix(path: str, suffix: str) -> "Iterator[str]":
+    """Recursively crawls the input directory tree and yields the paths to all files with the matching suffix.
+
+    Same scandir-based traversal as _scandir_recursive(), but matches file name suffixes (extensions) instead of
+    full file names.
+
+    Args:
+        path: The path to the root level of the directory to crawl.
+        suffix: The file name suffix (e.g.: '.pyi') to look for during the crawl.
+
+    Yields:
+        The absolute paths to all discovered files with the matching suffix.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # Symlinks are skipped to avoid escaping the crawled directory tree.
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive_suffix(entry.path, suffix)
+            elif entry.name.endswith(suffix):
+                yield entry.path
+
+
+def _require_dirs(*paths: str) -> None:
+    """Verifies that every input directory exists, aborting the runtime with a descriptive message otherwise.
+
+    This helper consolidates the identical existence-check boilerplate previously duplicated across the CLI
+    commands, issuing a single isdir probe per path and naming every missing directory in one message.
+
+    Args:
+        *paths: The absolute paths to the directories that have to exist for the caller to proceed.
+    """
+    missing_paths: list[str] = [path for path in paths if not os.path.isdir(path)]
+    if missing_paths:
+        message: str = format_message(
+            f"Unable to proceed: the following required directories do not exist: {', '.join(missing_paths)}."
+        )
+        click.echo(message, err=True)
+        raise click.Abort()
+
+
 def resolve_typed_markers(target_dir: AnyStr | PathLike[AnyStr]) -> None:
     """Crawls the input directory tree and resolves 'py.typed' marker file to match SunLab guidelines.
 
@@ -67,29 +176,44 @@ def resolve_typed_markers(target_dir: AnyStr | PathLike[AnyStr]) -> None:
         target_dir: The path to the root level of the directory to crawl. Usually, this is the '/src' directory of the
         project.
     """
-    # Loops over the target directory hierarchy.
-    evaluated_roots: set[str] = set()
-    level: int = 0
-    for root, _, files in os.walk(target_dir):
-        root_path = str(object=root)
-        file_names = [str(object=member) for member in files]
-
-        # Tracks the evaluated directory level.
-        if root not in evaluated_roots:
-            evaluated_roots.add(root_path)
-            level += 1
-
-        # If evaluated directory is the root directory and the py.typed marker is not found, adds the marker file.
-        if "py.typed" not in file_names and level == 1:
-            # Add py.typed to this package directory
-            with open(os.path.join(root_path, "py.typed"), "w") as _:
-                pass
-
-        # Removes any py.typed instances from all directories except the root directory.
-        elif level != 1:
-            dir_py_typed = os.path.join(root_path, "py.typed")
-            if os.path.exists(dir_py_typed):
-                os.remove(dir_py_typed)
+    # fsdecode() both unwraps PathLike inputs and normalizes bytes paths to str, so the joins below always operate
+    # on str paths.
+    root_path: str = os.fsdecode(target_dir)
+    root_py_typed: str = os.path.join(root_path, "py.typed")
+
+    # Removes any py.typed instances from all directories except the root directory.
+    for marker_path in _scandir_recursive(root_path, "py.typed"):
+        if marker_path != root_py_typed:
+            os.unlink(marker_path)
+
+    # If the py.typed marker is not found at the root directory level, adds the marker file. The marker only needs to
+    # exist, so it is created with a bare open/close syscall pair instead of constructing a Python file object.
+    if not os.path.lexists(root_py_typed):
+        os.close(os.open(root_py_typed, os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+def _run_file_operations(operation: Callable[..., object], argument_tuples: Sequence[tuple[str, ...]]) -> None:
+    """Applies the input filesystem operation to every argument tuple, parallelizing large batches.
+
+    Renames and unlinks are independent metadata operations whose cost is dominated by per-syscall latency, so large
+    batches are spread across a thread pool to let the kernel overlap the waits. Small batches run sequentially, as
+    the pool startup overhead would exceed the saved time.
+
+    Args:
+        operation: The filesystem operation (e.g.: os.unlink, os.replace) to apply.
+        argument_tuples: The list of argument tuples, one tuple per operation call.
+    """
+    if len(argument_tuples) < 16:
+        for arguments in argument_tuples:
+            operation(*arguments)
+        return
+
+    # Deferred to call runtime so that commands that never use the pool do not pay the import cost.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        # Consuming the map iterator both awaits completion and re-raises any exception from the worker threads.
+        list(executor.map(lambda arguments: operation(*arguments), argument_tuples))
 
 
 def move_stubs(src_dir: str, dst_dir: str) -> None:
@@ -105,85 +229,70 @@ def move_stubs(src_dir: str, dst_dir: str) -> None:
             project, depending on project type (c-extension or pure-python).
     """
 
-    # Iterates over all files of the input tree hierarchy
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            # For any file with python stub extension that matches the pattern, moves it to a mirroring directory level
-            # and name relative to the destination root.
-            if file.endswith(".pyi"):
-                stub_path = os.path.join(root, file)  # Parses the path to the stub file relative to the source root
-
-                # Finds the index of 'stubs' in the path
-                stubs_index: int = 0
-                path_parts = stub_path.split(os.path.sep)
-                try:
-                    stubs_index = path_parts.index("stubs")
-                except ValueError:
-                    message: str = format_message(
-                        f"Error: 'stubs' directory not found in path: {stub_path}. "
-                        f"Cannot move stub file to destination."
-                    )
-                    click.echo(message, err=True)
-                    click.Abort()
-
-                # Replace 'stubs' and the following directory (LIBRARY_NAME) with dst_dir
-                new_path_parts = [dst_dir] + path_parts[stubs_index + 2 :]
-                # noinspection PyTypeChecker
-                dst_path: str = os.path.join(*new_path_parts)
-
-                # Removes old .pyi file if it already exists
-                if os.path.exists(dst_path):
-                    os.remove(dst_path)
-
-                # Moves the stub to its destination directory
-                shutil.move(stub_path, dst_path)
-
-    # This loop is designed to solve a (so far) OSX-unique issue where this function results in multiple copies with
-    # appended copy_counts, rather than a single copy of the .pyi file.
-    for root, _, files in os.walk(dst_dir):
-        # Groups files by their base name (without a space number)
-        file_groups: dict[str, list[str]] = {}
-        for file in files:
-            if file.endswith(".pyi"):
-                base_name = re.sub(r" \d+\.pyi$", ".pyi", file)
-                if base_name not in file_groups:
-                    file_groups[base_name] = []
-                file_groups[base_name].append(file)
-
-        # For each group, keeps only the file with the highest space number and renames it
-        for base_name, group in file_groups.items():
-            if len(group) > 1:
-                # Sorts files by space number, in descending order
-                sorted_files = sorted(
-                    group,
-                    key=lambda x: (int(re.findall(r" (\d+)\.pyi$", x)[0]) if re.findall(r" (\d+)\.pyi$", x) else 0),
-                    reverse=True,
-                )
-
-                # Keeps the first file (highest space number), renames it, and removes the rest
-                kept_file = sorted_files[0]
-                kept_file_path = os.path.join(root, kept_file)
-                new_file_path = os.path.join(root, base_name)
-
-                # Removes the rest of the files
-                for file_to_remove in sorted_files[1:]:
-                    os.remove(os.path.join(root, file_to_remove))
-                    message = format_message(f"Removed duplicate file: {file_to_remove}")
-                    click.echo(message)
-
-                # Renames the kept file to remove the space number
-                os.rename(kept_file_path, new_file_path)
-                message = format_message(f"Renamed file: {kept_file} -> {base_name}")
+    # Iterates over all stub files of the source tree in a single scandir-based pass. Each stub is moved to the
+    # mirroring directory level and name relative to the destination root, and its destination path is grouped by the
+    # 'intended' (numberless) stub name as the move happens. This collects the data needed for the duplicate
+    # resolution step below without paying for a second traversal of the destination tree.
+    # Binds the hot os.path helpers to locals, removing the repeated module attribute lookups from the per-stub loop.
+    path_sep: str = os.path.sep
+    path_join = os.path.join
+    path_basename = os.path.basename
+    path_dirname = os.path.dirname
+
+    file_groups: dict[str, list[tuple[int, str]]] = {}
+    move_pairs: list[tuple[str, str]] = []
+    for stub_path in _scandir_recursive_suffix(src_dir, ".pyi"):
+        # Finds the index of 'stubs' in the path
+        stubs_index: int = 0
+        path_parts = stub_path.split(path_sep)
+        try:
+            stubs_index = path_parts.index("stubs")
+        except ValueError:
+            message: str = format_message(
+                f"Error: 'stubs' directory not found in path: {stub_path}. Cannot move stub file to destination."
+            )
+            click.echo(message, err=True)
+            click.Abort()
+
+        # Replace 'stubs' and the following directory (LIBRARY_NAME) with dst_dir
+        new_path_parts = [dst_dir] + path_parts[stubs_index + 2 :]
+        # noinspection PyTypeChecker
+        dst_path: str = path_join(*new_path_parts)
+
+        # Queues the stub move instead of executing it inline, so that the collected moves can be dispatched through
+        # a thread pool below. Both paths live under the project directory (same filesystem), so each move boils down
+        # to a single atomic rename syscall that also overwrites any pre-existing .pyi file, removing the need for the
+        # exists/remove pre-check and shutil.move's copy-fallback logic.
+        move_pairs.append((stub_path, dst_path))
+
+        # Records the moved stub into its duplicate-resolution group. Files with copy numbers appended (with a space)
+        # by OSX are grouped together with the numberless original. Non-duplicated files use copy number 0.
+        match = _PYI_DUP_PATTERN.match(path_basename(dst_path))
+        if match is None:
+            continue
+        base_path = path_join(path_dirname(dst_path), f"{match.group(1)}.pyi")
+        copy_number = int(match.group(2)) if match.group(2) else 0
+        file_groups.setdefault(base_path, []).append((copy_number, dst_path))
+
+    # Executes the queued moves. Each rename is an independent metadata operation, so on large stub sets the moves
+    # are spread across a thread pool to overlap the per-syscall latency; small sets run sequentially, as the pool
+    # startup cost would dominate the saved time.
+    _run_file_operations(os.replace, move_pairs)
+
+    # This step resolves a (so far) OSX-unique issue where the move above results in multiple copies with appended
+    # copy_counts, rather than a single copy of the .pyi file. For each group, keeps only the file with the highest
+    # copy number, removes the rest and renames the kept file to the intended (numberless) stub name.
+    for base_path, group in file_groups.items():
+        _, kept_path = max(group)
+        for _, duplicate_path in group:
+            if duplicate_path != kept_path:
+                os.unlink(duplicate_path)
+                message = format_message(f"Removed duplicate file: {path_basename(duplicate_path)}")
                 click.echo(message)
-            elif len(group) == 1:
-                # If there's only one file in the group, rename it if it has a space number
-                file = group[0]
-                if file != base_name:
-                    old_path = os.path.join(root, file)
-                    new_path = os.path.join(root, base_name)
-                    os.rename(old_path, new_path)
-                    message = format_message(f"Renamed file: {file} -> {base_name}")
-                    click.echo(message)
+        if kept_path != base_path:
+            os.rename(kept_path, base_path)
+            message = format_message(f"Renamed file: {path_basename(kept_path)} -> {path_basename(base_path)}")
+            click.echo(message)
 
 
 def delete_stubs(directory: str) -> None:
@@ -195,25 +304,23 @@ def delete_stubs(directory: str) -> None:
     Args:
         directory: The path to the root directory from which to start removing .pyi files.
     """
-    removed_files: list[str] = []
-
-    # Iterates over all files in the directory tree
-    for root, _, files in os.walk(directory):
-        for file in files:
-            # Checks if the file is a .pyi stub file
-            if file.endswith(".pyi"):
-                file_path = os.path.join(root, file)
-
-                # Removes the .pyi file
-                os.remove(file_path)
+    # Collects all .pyi stub files in the directory tree using the shared scandir-based crawler and removes each
+    # discovered file, spreading large batches across a thread pool to overlap the per-unlink latency. Reports one
+    # aggregate message after the crawl instead of echoing (and flushing) a line per removed file.
+    stub_paths: list[tuple[str]] = [(stub_path,) for stub_path in _scandir_recursive_suffix(directory, ".pyi")]
+    _run_file_operations(os.unlink, stub_paths)
 
-                message: str = format_message(f"Removed {file_path}.")
-                click.echo(message)
+    message: str = format_message(f"Removed {len(stub_paths)} .pyi files from {directory}.")
+    click.echo(message)
 
 
+@functools.lru_cache(maxsize=1)
 def resolve_library_root() -> str:
     """Determines the relative path to the library root directory inside the 'src' directory of the source code.
 
+    Like resolve_project_directory(), this function produces a constant result for the duration of a CLI invocation,
+    so the resolved root is cached after the first call.
+
     This function is primarily used by the functions such as stub-generators that generate the necessary files in a
     temporary directory and then need to distribute them to source code directories. Since our c-extension and
     pure-python use a slightly different layout, this function allows using the same automation code for both project
@@ -230,37 +337,43 @@ def resolve_library_root() -> str:
     project_dir: str = resolve_project_directory()
     src_path: str = os.path.join(project_dir, "src")
 
-    error_message: str = format_message(
-        "Unable to resolve the path to the (built) library root directory. Expected an __init__.py at the level of the "
-        "'src' or a single sub-directory with an __init__.py, but discovered neither. C-extensions should use 'src' "
-        "as the root directory and pure-python packages should have the python package stored directly under 'src'."
-    )
-
-    # If __init__.py is not found at the level of the src, this implies that the processed project is a pure python
-    # project and, in this case, it is expected that there is a single library-directory under /src that is the
-    # root.
-    if "__init__.py" not in os.listdir(src_path):
-
-        # Ensures there is a single directory at the level of the /src
-        directories: set[str] = set()
-        for candidate_name in os.listdir(src_path):
-            candidate_path: str = os.path.join(src_path, candidate_name)
-            if os.path.isdir(candidate_path):
-                directories.add(candidate_path)
-        if len(directories) != 1:
-            click.echo(error_message, err=True)
-            raise click.Abort()
+    def abort_unresolved() -> None:
+        """Formats and reports the shared resolution-failure message before aborting the runtime.
+
+        Keeping the message construction inside this closure defers the text-wrapping work to the error path, so
+        successful resolutions (the common case) never pay for it.
+        """
+        error_message: str = format_message(
+            "Unable to resolve the path to the (built) library root directory. Expected an __init__.py at the level "
+            "of the 'src' or a single sub-directory with an __init__.py, but discovered neither. C-extensions should "
+            "use 'src' as the root directory and pure-python packages should have the python package stored directly "
+            "under 'src'."
+        )
+        click.echo(error_message, err=True)
+        raise click.Abort()
 
-        # Ensures the single directory has the init.py
-        candidate_path = directories.pop()
-        if "__init__.py" not in os.listdir(candidate_path):
-            click.echo(error_message, err=True)
-            raise click.Abort()
+    # Enumerates the 'src' directory once via os.scandir, which caches entry metadata and avoids issuing an extra
+    # stat() call per entry to classify it as a file or a directory.
+    with os.scandir(src_path) as scanned_entries:
+        src_entries: list[os.DirEntry[str]] = list(scanned_entries)
 
     # If __init__.py is found at the level of the src, this is used as a heuristic that this library
     # is a c-extension library and does not contain a 'root' package (instead, src is the root).
-    else:
-        candidate_path = src_path
+    if any(entry.name == "__init__.py" and entry.is_file() for entry in src_entries):
+        return src_path
+
+    # Otherwise, this implies that the processed project is a pure python project and, in this case, it is expected
+    # that there is a single library-directory under /src that is the root. Ensures there is a single directory at
+    # the level of the /src.
+    directories: list[str] = [entry.path for entry in src_entries if entry.is_dir(follow_symlinks=False)]
+    if len(directories) != 1:
+        abort_unresolved()
+
+    # Ensures the single directory has the init.py
+    candidate_path: str = directories[0]
+    with os.scandir(candidate_path) as scanned_entries:
+        if not any(entry.name == "__init__.py" for entry in scanned_entries):
+            abort_unresolved()
 
     return candidate_path
 
@@ -287,11 +400,7 @@ def process_typed_markers() -> None:
     # Resolves the target directory
     project_dir: str = resolve_project_directory()
     src_path: str = os.path.join(project_dir, "src")
-
-    if not os.path.exists(src_path):
-        message: str = format_message("Unable to resolve typed markers. Source directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
+    _require_dirs(src_path)
 
     # Uses '__init__.py' presence and some additional heuristics to determine the root directory of the built library
     # (either src or the first python package). This depends on the project type (c-extension or pure-python).
@@ -324,23 +433,54 @@ def process_stubs() -> None:
     project_dir: str = resolve_project_directory()
     src_path: str = os.path.join(project_dir, "src")
     stubs_path: str = os.path.join(project_dir, "stubs")
+    _require_dirs(src_path, stubs_path)
 
-    if not os.path.exists(src_path):
-        message = format_message("Unable to move stub files. Source directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
-    if not os.path.exists(stubs_path):
-        message = format_message("Unable to move stub files. Stubs directory does not exist.")
+    # Uses '__init__.py' presence and some additional heuristics to determine the root directory of the built library
+    # (either src or the first python package). This depends on the project type (c-extension or pure-python).
+    library_root: str = resolve_library_root()
+
+    # Moves the stubs to the appropriate source code directories
+    try:
+        # Distributes the stubs across source directory
+        move_stubs(src_dir=stubs_path, dst_dir=library_root)
+        shutil.rmtree(stubs_path)  # Removes the directory
+        message = format_message("Stubs: Distributed.")
+        click.echo(message)
+    except Exception as e:
+        message = format_message(f"Error processing stubs: {str(e)}")
         click.echo(message, err=True)
         raise click.Abort()
 
+
+@cli.command()
+def process_stubs_pipeline() -> None:
+    """Sequentially resolves the 'py.typed' markers and distributes the generated stub files in a single process.
+
+    This command fuses the process_typed_markers and process_stubs steps, which tox otherwise runs as two separate
+    CLI processes. Running both in one process amortizes the interpreter startup, module imports, and the (cached)
+    project and library root resolution over both steps. The standalone commands remain available for pipelines that
+    need to run the steps individually.
+
+    Raises:
+        RuntimeError: If root (highest) directory cannot be resolved. If the function runs into an error
+            processing 'py.typed' markers or stubs. If 'src' or 'stubs' directories do not exist.
+    """
+    # Resolves the target directories
+    project_dir: str = resolve_project_directory()
+    src_path: str = os.path.join(project_dir, "src")
+    stubs_path: str = os.path.join(project_dir, "stubs")
+    _require_dirs(src_path, stubs_path)
+
     # Uses '__init__.py' presence and some additional heuristics to determine the root directory of the built library
     # (either src or the first python package). This depends on the project type (c-extension or pure-python).
     library_root: str = resolve_library_root()
 
-    # Moves the stubs to the appropriate source code directories
+    # Runs both processing steps back-to-back, reusing the roots resolved above.
     try:
-        # Distributes the stubs across source directory
+        resolve_typed_markers(target_dir=library_root)
+        message = format_message("Typed Markers: Resolved.")
+        click.echo(message)
+
         move_stubs(src_dir=stubs_path, dst_dir=library_root)
         shutil.rmtree(stubs_path)  # Removes the directory
         message = format_message("Stubs: Distributed.")
@@ -366,11 +506,7 @@ def purge_stubs() -> None:
     # Resolves the target directory
     project_dir: str = resolve_project_directory()
     src_path: str = os.path.join(project_dir, "src")
-
-    if not os.path.exists(src_path):
-        message: str = format_message("Unable to purge existing stub files. Source directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
+    _require_dirs(src_path)
 
     # Uses '__init__.py' presence and some additional heuristics to determine the root directory of the built library
     # (either src or the first python package). This depends on the project type (c-extension or pure-python).
@@ -401,7 +537,20 @@ def generate_recipe_folder() -> None:
     project_dir: str = resolve_project_directory()
     recipe_path: str = os.path.join(project_dir, "recipe")
 
-    if not os.path.exists(recipe_path):
+    # Removes a stale rename-aside leftover from a previous (interrupted) run before reusing its name. The removal
+    # doubles as the existence probe, so the common 'no leftover' case costs a single failed syscall.
+    old_recipe_path: str = f"{recipe_path}.old"
+    try:
+        shutil.rmtree(old_recipe_path)
+    except FileNotFoundError:
+        pass
+
+    # Attempts the rename-aside directly and treats the FileNotFoundError raised for a missing folder as the signal
+    # to generate it from scratch. This replaces the previous upfront os.path.exists() probe, saving one stat
+    # syscall per invocation on both branches.
+    try:
+        os.replace(recipe_path, old_recipe_path)
+    except FileNotFoundError:
         # If the folder does not exist, generates it from scratch
         try:
             os.makedirs(recipe_path)
@@ -412,9 +561,13 @@ def generate_recipe_folder() -> None:
             click.echo(message, err=True)
             raise click.Abort()
     else:
-        # If the folder does exist, recreates it (to remove the potentially existing recipe)
-        shutil.rmtree(recipe_path)
+        # If the folder does exist, recreates it (to remove the potentially existing recipe). Rather than waiting for
+        # the recursive removal to unlink every old recipe file, the folder was atomically renamed aside above, so a
+        # fresh (empty) replacement is created immediately and the renamed folder is deleted in a background thread.
+        # The thread is deliberately non-daemon: the interpreter joins it at exit, so the deletion overlaps the rest
+        # of the command but is still guaranteed to finish instead of being killed mid-removal at shutdown.
         os.makedirs(recipe_path)
+        threading.Thread(target=shutil.rmtree, args=(old_recipe_path,)).start()
         message = format_message("Recipe Directory: Recreated.")
         click.echo(message)
 
@@ -429,15 +582,23 @@ def is_valid_pypirc(file_path: str) -> bool:
     Returns:
         True if the .pypirc is well-configured configured and False otherwise.
     """
-    config_validator = configparser.ConfigParser()
-    config_validator.read(file_path)
-    return (
-        config_validator.has_section("pypi")
-        and config_validator.has_option("pypi", "username")
-        and config_validator.has_option("pypi", "password")
-        and config_validator.get("pypi", "username") == "__token__"
-        and config_validator.get("pypi", "password").startswith("pypi-")
-    )
+    # The '.pypirc' files written by this module follow a known-minimal schema, so a direct scan of the file text
+    # replaces the full configparser tokenization and nested mapping construction.
+    try:
+        with open(file_path, "r") as f:
+            content: str = f.read()
+    except OSError:
+        return False
+
+    # Quick rejection pass: all three tokens have to be present somewhere in the file for it to be valid.
+    if "[pypi]" not in content or "__token__" not in content or "pypi-" not in content:
+        return False
+
+    # Locates the '[pypi]' section and verifies both authentication options are defined inside that section.
+    for section in _INI_SECTION_SPLIT.split(content):
+        if section.startswith("pypi]"):
+            return bool(_PYPIRC_USERNAME_PATTERN.search(section)) and bool(_PYPIRC_PASSWORD_PATTERN.search(section))
+    return False
 
 
 @cli.command()
@@ -472,7 +633,7 @@ def set_pypi_token(replace_token: bool) -> None:
 
     # If file exists, recreating the file is not requested and the file appears well-formed, ends the runtime.
     if os.path.exists(pypirc_path) and is_valid_pypirc(pypirc_path) and not replace_token:
-        message: str = format_message(f"PyPI Token: extracted from the '.pypirc' file.")
+        message: str = format_message("PyPI Token: extracted from the '.pypirc' file.")
         click.echo(message)
         return
 
@@ -480,8 +641,8 @@ def set_pypi_token(replace_token: bool) -> None:
     # token.
     else:
         message = format_message(
-            f"PyPI Token: '.pypirc' file does not exist, is invalid or doesn't contain a token. Proceeding to create "
-            f"a new one."
+            "PyPI Token: '.pypirc' file does not exist, is invalid or doesn't contain a token. Proceeding to create "
+            "a new one."
         )
         click.echo(message)
 
@@ -497,16 +658,19 @@ def set_pypi_token(replace_token: bool) -> None:
                 hide_input=True,
             )
 
-            # Catches and prevents entering incorrectly formatted tokens
-            if not token.startswith("pypi-"):
-                message = format_message("Invalid token format. PyPI tokens should start with 'pypi-'.")
+            # Catches and prevents entering incorrectly formatted tokens. Whitespace is rejected alongside the
+            # prefix check, as it would corrupt the ini layout written below.
+            if not token.startswith("pypi-") or any(character.isspace() for character in token):
+                message = format_message(
+                    "Invalid token format. PyPI tokens should start with 'pypi-' and contain no whitespace."
+                )
                 raise ValueError(message)
 
-            # Generates the new .pypirc file and saves the valid token data to the file.
-            config = configparser.ConfigParser()
-            config["pypi"] = {"username": "__token__", "password": token}
+            # Generates the new .pypirc file and saves the valid token data to the file. The file layout is fixed and
+            # minimal, so it is written directly, matching the output configparser would produce for the same data
+            # without building a parser object.
             with open(pypirc_path, "w") as f:
-                config.write(f)
+                f.write(f"[pypi]\nusername = __token__\npassword = {token}\n\n")
 
             # Notifies the user and breaks out of the while loop
             message = format_message("PyPI Token: Valid token added to '.pypirc'.")
@@ -533,52 +697,69 @@ def get_env_extension() -> str:
     Raises:
         BadParameter: If the host OS does not match any of the supported operating systems.
     """
-    os_name: str = sys.platform
-    if os_name == "win32":
-        return "_win"
-    elif os_name == "linux":
-        return "_lin"
-    elif os_name == "darwin":
-        return "_osx"
-    else:
-        message: str = format_message(f"Unsupported host operating system: {os_name}.")
+    if _PLATFORM_SUFFIX is None:
+        message: str = format_message(f"Unsupported host operating system: {sys.platform}.")
         raise click.BadParameter(message)
+    return _PLATFORM_SUFFIX
 
 
+@functools.lru_cache(maxsize=1)
 def get_conda_cmdlet() -> str:
-    """Determines whether mamba or conda can be accessed from this script by silently calling 'command --version'.
+    """Determines whether mamba or conda can be accessed from this script by looking the cmdlets up in the PATH.
 
     If mamba is available, it is used over conda. This process optimizes conda-related operations
-    (especially de novo environment creation) to use the fastest available engine.
+    (especially de novo environment creation) to use the fastest available engine. The lookup uses shutil.which()
+    instead of spawning '--version' subprocesses, which avoids paying the process startup cost for each probe, and the
+    result is cached for the lifetime of the process.
 
     Returns:
         The string-name of the cmdlet to use for all conda (or mamba) related commands.
 
     Raises:
-        RuntimeError: If neither conda nor mamba is accessible via subprocess call through the shell.
+        RuntimeError: If neither conda nor mamba is discoverable through the PATH.
     """
-
     command: str
     commands: tuple[str, str] = ("mamba", "conda")
     for command in commands:
-        try:
-            subprocess.run(
-                f"{command} --version",
-                shell=True,
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            return command  # If the command above runs, returns the cmdlet name
-        except subprocess.CalledProcessError:
-            continue  # For failed command, cycles to the next command in the cycle or to the general error below.
+        if shutil.which(command) is not None:
+            return command  # If the cmdlet is found in the PATH, returns the cmdlet name
 
     # If this point in the runtime is reached, this means neither conda nor mamba is installed or accessible.
-    message = format_message(f"Unable to interface with either conda or mamba. Is it installed and added to Path?")
+    message = format_message("Unable to interface with either conda or mamba. Is it installed and added to Path?")
     click.echo(message, err=True)
     raise click.Abort()
 
 
+def _run_streamed(command: list[str]) -> None:
+    """Runs the input command as a subprocess, relaying its output to stdout through large buffered writes.
+
+    Letting the child process inherit the parent's stdout forwards every output line straight to the console (or the
+    tox log pipe), paying the per-write flush cost line by line. This helper instead captures the child's combined
+    output through a pipe and re-emits it in large chunks, producing fewer, bigger writes to the output sink.
+
+    Args:
+        command: The argument-list command to execute.
+
+    Raises:
+        CalledProcessError: If the executed command returns a non-zero exit code.
+    """
+    # Deferred to call runtime so that commands that never spawn processes do not pay the import cost.
+    import io
+    import subprocess
+
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
+        # The bytes-mode pipe is always a BufferedReader (which exposes read1()), but typeshed types the attribute
+        # as Optional[IO[bytes]], so the concrete type is restored via cast for static type-checking.
+        stdout = cast(io.BufferedReader, process.stdout)
+        # read1() returns as soon as any output is available (up to the cap), so long-running cmdlets keep showing
+        # progress instead of stalling until a full chunk accumulates.
+        for chunk in iter(lambda: stdout.read1(65536), b""):
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+
+
 @cli.command()
 def import_env() -> None:
     """Creates or updates an existing Conda environment based on the operating system-specific .yml file stored in
@@ -590,27 +771,28 @@ def import_env() -> None:
         RuntimeError: If there is no .yml file for the desired base-name and OS-extension combination in the 'envs'
             folder. If creation and update commands both fail for any reason. If 'envs' folder does not exist
     """
+    # Deferred to command runtime so that commands that never use these modules do not pay the import cost.
+    import glob
+    import subprocess
+
     # Resolves target directory
     project_dir: str = resolve_project_directory()
     envs_path = os.path.join(project_dir, "envs")
-
-    if not os.path.exists(envs_path):
-        message: str = format_message(f"Unable to import conda environment. '/envs' directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
+    _require_dirs(envs_path)
 
     env_postfix: str = get_env_extension()  # Uses host OS name to generate the appropriate environment postfix.
     yml_file: str = f"{env_postfix}.yml"  # Concatenates the postfix with the .yml extension.
 
-    # Scans the 'envs' directory and discovers the first file with the matching postfix and extension. If a match is
-    # found, uses it to set the path to the .yml file and the name to use in string-reports.
+    # Discovers the file with the matching postfix and extension via a single native glob pattern, instead of
+    # enumerating and substring-testing every 'envs' directory entry in Python. Sorting makes the pick deterministic
+    # when multiple files match. If a match is found, uses it to set the path to the .yml file and the name to use in
+    # string-reports.
     yml_path: Optional[str] = None
     env_name: Optional[str] = None
-    for file in os.listdir(envs_path):
-        if yml_file in file:
-            yml_path = os.path.join(envs_path, file)
-            env_name = file.split(".")[0]
-            break
+    matching_files: list[str] = sorted(glob.glob(os.path.join(envs_path, f"*{yml_file}")))
+    if matching_files:
+        yml_path = matching_files[0]
+        env_name = os.path.basename(yml_path).split(".")[0]
 
     # If the OS-specific .yml file is not found, raises an error
     if yml_path is None:
@@ -625,8 +807,10 @@ def import_env() -> None:
     cmdlet_name: str = get_conda_cmdlet()
 
     # If the .yml file was found, attempts to create a new environment by calling appropriate cmdlet via subprocess.
+    # The commands are passed as argument lists, which executes the cmdlet directly without forking an intermediate
+    # shell process.
     try:
-        subprocess.run(f"{cmdlet_name} env create -f {yml_path}", shell=True, check=True)
+        _run_streamed([cmdlet_name, "env", "create", "-f", yml_path])
         message = format_message(f"Environment '{env_name}' created successfully.")
         click.echo(message)
         return
@@ -636,7 +820,7 @@ def import_env() -> None:
     # If environment creation fails, this is likely due to the environment already existing. Therefore, upon the
     # first error, attempts to instead update the existing environment using the same.yml file
     try:
-        subprocess.run(f"{cmdlet_name} env update -f {yml_path} --prune", shell=True, check=True)
+        _run_streamed([cmdlet_name, "env", "update", "-f", yml_path, "--prune"])
         message = format_message(f"Environment '{env_name}' already exists and was instead updated successfully.")
         click.echo(message)
     # If the update attempt also fails, aborts with an error.
@@ -646,45 +830,25 @@ def import_env() -> None:
         raise click.Abort()
 
 
-def get_export_command(
-    cmdlet_name: str,
-    env_name: str,
-    yml_path: str,
-    spec_path: str,
-) -> tuple[str, str]:
-    """Resolves the appropriate environment .yml and spec.txt export commands based on the platform OS version.
+def get_export_command(cmdlet_name: str, env_name: str) -> tuple[list[str], list[str]]:
+    """Resolves the environment .yml and spec.txt export commands as subprocess argument lists.
 
-    Supports the same set of OS versions as get_env_extension(). Primary reason for using separate commands is to
-    make sure they remove the prefix from the exported .yml file (primarily for privacy reasons).
+    The returned commands print the export data to stdout; the caller is responsible for capturing the output,
+    removing the environment prefix from the .yml data (primarily for privacy reasons) and writing the results to
+    the appropriate 'envs' folder files. Keeping the prefix removal in-process makes the commands identical across
+    all supported OS versions and lets the cmdlets run directly, without an intermediate shell to drive OS-specific
+    filtering and redirection pipelines.
 
     Args:
         cmdlet_name: The name of the execution cmdlet, valid options are 'conda' and 'mamba'.
         env_name: The base-name of the environment to export.
-        yml_path: The path to use for exporting the environment as a .yml file.
-        spec_path: The path to use for exporting the environment as a spec.txt file.
-
-    Returns: A tuple of two string-commands. The first command can be passed (via subprocess) to conda or mamba
-        to export the environment for the current project to 'envs' folder as a .yml file. THe second exports the
-        spec.txt list with revision history to the same folder.
 
-    Raises:
-        BadParameter: If the host OS does not match any of the supported operating systems.
+    Returns: A tuple of two argument-list commands. The first command can be passed (via subprocess) to conda or
+        mamba to print the .yml export data for the environment. The second prints the spec.txt list with revision
+        history.
     """
-    os_name: str = sys.platform
-    # Determines the OS-specific command to export the environment as a .yml file while removing the prefix.
-    if os_name == "win32":
-        yml_command: str = f'{cmdlet_name} env export --name {env_name} | findstr -v "prefix" > {yml_path}'
-    elif os_name == "linux":
-        yml_command = f"{cmdlet_name} env export --name {env_name} | head -n -1 > {yml_path}"
-    elif os_name == "darwin":
-        yml_command = f"{cmdlet_name} env export --name {env_name} | tail -r | tail -n +2 | tail -r > {yml_path}"
-    else:
-        message: str = format_message(f"Unsupported host operating system: {os_name}.")
-        raise click.BadParameter(message)
-
-    # Uses the same spec-command regardless of the OS-specific .yml command.
-    spec_command: str = f"{cmdlet_name} list -n {env_name} --explicit -r > {spec_path}"
-
+    yml_command: list[str] = [cmdlet_name, "env", "export", "--name", env_name]
+    spec_command: list[str] = [cmdlet_name, "list", "-n", env_name, "--explicit", "-r"]
     return yml_command, spec_command
 
 
@@ -705,14 +869,13 @@ def export_env(base_env: str) -> None:
     Raises:
         RuntimeError: If 'envs' directory does not exist. If any environment export command fails for any reason.
     """
+    # Deferred to command runtime so that commands that never spawn processes do not pay the import cost.
+    import subprocess
+
     # Resolves target directory
     project_dir: str = resolve_project_directory()
     envs_path = os.path.join(project_dir, "envs")
-
-    if not os.path.exists(envs_path):
-        message: str = format_message(f"Unable to export conda environment. '/envs' directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
+    _require_dirs(envs_path)
 
     # Selects the environment name according to the host OS and constructs the path to the environment .yml and spec
     # files using the generated name.
@@ -726,22 +889,46 @@ def export_env(base_env: str) -> None:
     cmdlet_name: str = get_conda_cmdlet()
 
     # Resolves the commands to execute for exporting the environment as a .yml and a spec.txt files.
-    yml_export_command: str
-    spec_export_command: str
-    # noinspection PyTypeChecker
-    yml_export_command, spec_export_command = get_export_command(cmdlet_name, env_name, yml_path, spec_path)
-
-    # Handles environment export using the commands obtained above
+    yml_export_command: list[str]
+    spec_export_command: list[str]
+    yml_export_command, spec_export_command = get_export_command(cmdlet_name, env_name)
+
+    # Handles environment export using the commands obtained above. The cmdlets are invoked directly with argument
+    # lists (no intermediate shell). The two exports read the same environment metadata independently, so both
+    # processes are launched back-to-back and awaited together, bounding the command's wall time by the slower of the
+    # two exports instead of their sum. The 'prefix' line appended to the .yml export data is stripped in-process,
+    # which replaces the OS-specific shell filtering pipelines.
     try:
-        subprocess.run(yml_export_command, shell=True, check=True)
+        with open(spec_path, "w") as f:
+            spec_export = subprocess.Popen(spec_export_command, stdout=f, stderr=subprocess.PIPE, text=True)
+            yml_export = subprocess.Popen(
+                yml_export_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+
+            yml_stdout, yml_stderr = yml_export.communicate()
+            _, spec_stderr = spec_export.communicate()
+
+        # Verifies both exports succeeded before writing any output, reporting the first encountered failure in the
+        # same format as subprocess.run(check=True).
+        if yml_export.returncode != 0:
+            raise subprocess.CalledProcessError(yml_export.returncode, yml_export_command, stderr=yml_stderr)
+        if spec_export.returncode != 0:
+            raise subprocess.CalledProcessError(spec_export.returncode, spec_export_command, stderr=spec_stderr)
+
+        yml_lines = [line for line in yml_stdout.splitlines() if not line.startswith("prefix:")]
+        with open(yml_path, "w") as f:
+            f.write("\n".join(yml_lines) + "\n")
         message = format_message(f"Environment exported to {yml_path}.")
         click.echo(message)
-        subprocess.run(spec_export_command, shell=True, check=True)
+
         message = format_message(f"Environment spec-file exported to {spec_path}")
         click.echo(message)
 
     except subprocess.CalledProcessError as e:
-        message = format_message(f"Error exporting environment: {str(e)}")
+        # Includes the tail of the failed cmdlet's stderr in the report, as the generic CalledProcessError text only
+        # names the command and exit code.
+        error_details: str = f" Details: {e.stderr.strip()[-4096:]}" if e.stderr else ""
+        message = format_message(f"Error exporting environment: {str(e)}{error_details}")
         click.echo(message, err=True)
         raise click.Abort()
 
@@ -766,15 +953,16 @@ def rename_all_envs(new_name: str) -> None:
     # Resolves target directory
     project_dir: str = resolve_project_directory()
     envs_dir: str = os.path.join(project_dir, "envs")
+    _require_dirs(envs_dir)
 
-    # If environments directory does not exist, aborts the runtime.
-    if not os.path.exists(envs_dir):
-        message: str = format_message(f"Unable to export conda environment. '/envs' directory does not exist.")
-        click.echo(message, err=True)
-        raise click.Abort()
+    # Enumerates the 'envs' directory once via os.scandir, which provides both the file name and the pre-built file
+    # path for every entry. The entries are materialized upfront, as the loop below renames and removes files from
+    # the scanned directory.
+    with os.scandir(envs_dir) as scanned_entries:
+        env_files: list[tuple[str, str]] = [(entry.name, entry.path) for entry in scanned_entries]
 
     # Loops over every file inside 'envs' directory
-    for file in os.listdir(envs_dir):
+    for file, old_file_path in env_files:
         # For .yml file, finds the last underscore
         if file.endswith(".yml"):
             last_underscore_index = file.rfind("_")
@@ -787,20 +975,27 @@ def rename_all_envs(new_name: str) -> None:
             # '.yml' extension.
             os_suffix_and_ext = file[last_underscore_index:]
             new_file_name = f"{new_name}{os_suffix_and_ext}"  # Underscore from suffix is kept
-            old_file_path = os.path.join(envs_dir, file)
             new_file_path = os.path.join(envs_dir, new_file_name)
 
-            # Reads the YAML file.
+            # Reads the raw file contents and rewrites the top-level 'name' field with a single in-place text
+            # substitution. This skips parsing and re-emitting the whole dependency list and preserves the original
+            # file formatting exactly. The '.yml' extension is stripped from the name written into the file.
             with open(old_file_path, "r") as f:
-                yaml_data = yaml.safe_load(f)
-
-            # Updates the environment name inside the YAML file (changes the value of the 'name' field).
-            if "name" in yaml_data:
-                yaml_data["name"] = new_file_name[:-4]  # Removes the '.yml' extension
-
-            # Writes the updated YAML data to the new file. Does not sort the keys to prevent altering file order.
-            with open(new_file_path, "w") as f:
-                yaml.safe_dump(yaml_data, f, sort_keys=False)
+                content: str = f.read()
+            new_content, matched = _YML_NAME_PATTERN.subn(f"name: {new_file_name[:-4]}", content, count=1)
+
+            if matched:
+                with open(new_file_path, "w") as f:
+                    f.write(new_content)
+
+            # Defensively falls back to the full YAML round-trip when the file does not contain a recognizable
+            # top-level 'name' field. Does not sort the keys to prevent altering file order.
+            else:
+                yaml_data = yaml.load(content, Loader=_YamlLoader)
+                if "name" in yaml_data:
+                    yaml_data["name"] = new_file_name[:-4]  # Removes the '.yml' extension
+                with open(new_file_path, "w") as f:
+                    yaml.dump(yaml_data, f, Dumper=_YamlDumper, sort_keys=False)
 
             # Remove the old file.
             os.remove(old_file_path)
@@ -819,7 +1014,6 @@ def rename_all_envs(new_name: str) -> None:
             # Otherwise renames the file (replaces the old file with a new one)
             os_suffix_and_ext = file[last_underscore_index:]
             new_file_name = f"{new_name}{os_suffix_and_ext}"
-            old_file_path = os.path.join(envs_dir, file)
             new_file_path = os.path.join(envs_dir, new_file_name)
             os.rename(old_file_path, new_file_path)
 
@@ -837,7 +1031,7 @@ def validate_library_name(_ctx: click.Context, _param: click.Parameter, value: s
     Raises:
         BadParameter: If the input value contains invalid characters.
     """
-    if not re.match(r"^[a-zA-Z0-9_]*$", value):
+    if not _NAME_PATTERN.fullmatch(value):
         message: str = format_message("Library name should contain only letters, numbers, and underscores.")
         raise click.BadParameter(message)
     return value
@@ -854,7 +1048,7 @@ def validate_project_name(_ctx: click.Context, _param: click.Parameter, value: s
     Raises:
         BadParameter: If the input value contains invalid characters.
     """
-    if not re.match(r"^[a-zA-Z0-9-]+$", value):
+    if not _PROJECT_NAME_PATTERN.match(value):
         message: str = format_message("Project name should contain only letters, numbers, or dashes.")
         raise click.BadParameter(message)
     return value
@@ -871,12 +1065,36 @@ def validate_author_name(_ctx: click.Context, _param: click.Parameter, value: st
     Raises:
         BadParameter: If the input value does not match the expected format.
     """
-    pattern = r"^([a-zA-Z\s\-']+)(\s*\([a-zA-Z0-9\-]+\))?$"
-    if not re.match(pattern, value):
-        message: str = format_message(
-            f"Author name should be in the format 'Human Name' or 'Human Name (GitHubUsername)'. "
-            f"The name can contain letters, spaces, hyphens, and apostrophes. The GitHub username "
-            f"(if provided) should be in parentheses and can contain letters, numbers, and hyphens."
+    # Rejects absurdly long inputs upfront: no real author name comes close to this cap, and the O(1) length check
+    # bounds the work the scans below can be made to do by pathological input.
+    if len(value) > 100:
+        message: str = format_message("Author name is too long. Keep it under 100 characters.")
+        raise click.BadParameter(message)
+
+    # Splits the value into the human name and the optional parenthesized GitHub username and validates both parts
+    # with direct character scans. This replaces a two-group backtracking regex with C-level string traversal and
+    # cannot exhibit pathological backtracking on adversarial input. The isascii() checks keep the accepted alphabet
+    # identical to the previous explicit [a-zA-Z] character classes.
+    name_part, separator, username_part = value.partition("(")
+    valid: bool = (
+        bool(name_part)
+        and name_part.isascii()
+        and all(character.isalpha() or character.isspace() or character in "-'" for character in name_part)
+    )
+    if valid and separator:
+        username = username_part[:-1]
+        valid = (
+            username_part.endswith(")")
+            and bool(username)
+            and username.isascii()
+            and all(character.isalnum() or character == "-" for character in username)
+        )
+
+    if not valid:
+        message = format_message(
+            "Author name should be in the format 'Human Name' or 'Human Name (GitHubUsername)'. "
+            "The name can contain letters, spaces, hyphens, and apostrophes. The GitHub username "
+            "(if provided) should be in parentheses and can contain letters, numbers, and hyphens."
         )
         raise click.BadParameter(message)
     return value
@@ -893,7 +1111,9 @@ def validate_email(_ctx: click.Context, _param: click.Parameter, value: str) ->
     Raises:
         BadParameter: If the input value contains invalid characters.
     """
-    if not re.match(r"^[\w.-]+@[\w.-]+\.\w+$", value):
+    # Rejects inputs above the RFC 5321 address length limit before running the regex, bounding the worst-case
+    # backtracking work the pattern can be driven into by adversarial input.
+    if len(value) > 254 or not _EMAIL_PATTERN.match(value):
         message: str = format_message("Invalid email address.")
         raise click.BadParameter(message)
 
@@ -911,7 +1131,7 @@ def validate_env_name(_ctx: click.Context, _param: click.Parameter, value: str)
     Raises:
         BadParameter: If the input value contains invalid characters.
     """
-    if not re.match(r"^[a-zA-Z0-9_]*$", value):
+    if not _NAME_PATTERN.fullmatch(value):
         message: str = format_message("Environment name should contain only letters, numbers, and underscores.")
         raise click.BadParameter(message)
     return value
@@ -930,7 +1150,27 @@ def rename_environments(new_name: str) -> None:
     rename_all_envs(new_name=new_name)
 
 
-def replace_markers_in_file(file_path: str, markers: dict[str, str]) -> int:
+def _compile_marker_pattern(markers: dict[str, str]) -> re.Pattern[bytes]:
+    """Compiles the input markers into a single alternation pattern that matches any of the marker keys.
+
+    The pattern operates on UTF-8 encoded bytes, as replace_markers_in_file() scans and rewrites raw file bytes
+    without decoding them. The markers are ordered longest-first inside the pattern to correctly handle markers that
+    are prefixes of other markers. Callers that process many files with the same markers should compile the pattern
+    once and pass it to every replace_markers_in_file() call.
+
+    Args:
+        markers: A shallow dictionary that contains markers to replace as keys and replacement values as values.
+
+    Returns:
+        The compiled bytes-pattern that matches every marker key.
+    """
+    encoded_markers: list[bytes] = sorted((marker.encode("utf-8") for marker in markers), key=len, reverse=True)
+    return re.compile(b"|".join(map(re.escape, encoded_markers)))
+
+
+def replace_markers_in_file(
+    file_path: str, markers: dict[str, str], pattern: Optional[re.Pattern[bytes]] = None
+) -> int:
     """Replaces all occurrences of every marker in the input file contents with the appropriate replacement value.
 
     This method opens the file and scans through file contents searching for any of 'markers' dictionary keys. If keys
@@ -940,30 +1180,55 @@ def replace_markers_in_file(file_path: str, markers: dict[str, str]) -> int:
     Args:
         file_path: The path to file in which to replace the markers.
         markers: A shallow dictionary that contains markers to replace as keys and replacement values as values.
+        pattern: The precompiled alternation pattern produced by _compile_marker_pattern() for the input markers.
+            When omitted, the pattern is compiled on the fly.
 
     Returns:
         The number of placeholder values modified during this method's runtime. Minimum number is 0 for no
         modifications.
     """
-    # Opens the file and reads its contents using utf-8 decoding.
-    with open(file_path, "r") as f:
-        content: str = f.read()
-
-    # Loops over markers and replaces any occurrence of any marker inside the file contents with the corresponding
-    # replacement value.
-    modification_count: int = 0
-    marker: str
-    value: str
-    for marker, value in markers.items():
-        if marker in content:
-            content = content.replace(marker, value)
-            modification_count += 1
+    # Deferred to call runtime so that commands that never rewrite file contents do not pay the import cost.
+    import mmap
+
+    # Pre-encodes the markers once per call. All scanning and replacement below operates on raw UTF-8 bytes, which
+    # skips the decode/encode codec passes entirely for the processed (ASCII-dominated) template files.
+    encoded_markers: dict[bytes, bytes] = {
+        marker.encode("utf-8"): value.encode("utf-8") for marker, value in markers.items()
+    }
+
+    # Memory-maps the file and probes the raw bytes for marker occurrences before materializing any copies. Most
+    # scanned files contain no markers, so this avoids buffering (and later rewriting) untouched files entirely.
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0  # Zero-length files cannot be memory-mapped and cannot contain markers.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            if all(mapped_file.find(marker) == -1 for marker in encoded_markers):
+                return 0
+            content: bytes = bytes(mapped_file)
+
+    # Replaces every occurrence of every marker in one pass over the file contents using the single alternation
+    # pattern, instead of rescanning the full contents once per marker.
+    if pattern is None:
+        pattern = _compile_marker_pattern(markers)
+    matched_markers: set[bytes] = set()
+
+    def _substitute(match: re.Match[bytes]) -> bytes:
+        matched_markers.add(match.group(0))
+        return encoded_markers[match.group(0)]
+
+    content = pattern.sub(_substitute, content)
+
+    # Counts each distinct marker found in the file once, regardless of how many times it occurred.
+    modification_count: int = len(matched_markers)
 
     # If any markers were modified, writes the modified contents back to file and notifies the user that the file has
-    # been modified.
+    # been modified. The contents are written to a temporary file first and swapped in via os.replace so the
+    # modification is atomic.
     if modification_count != 0:
-        with open(file_path, "w") as f:
-            f.write(content)
+        temporary_path: str = f"{file_path}.tmp"
+        with open(temporary_path, "wb") as output_file:
+            output_file.write(content)
+        os.replace(temporary_path, file_path)
         click.echo(f"Replaced markers in {file_path}")
         return modification_count  # Returns the total number of positive modifications
 
@@ -971,6 +1236,80 @@ def replace_markers_in_file(file_path: str, markers: dict[str, str]) -> int:
     return modification_count
 
 
+# Directories that never contain template placeholders and are potentially very expensive to crawl (version control
+# data, virtual environments, build artifacts and tool caches). The adoption crawl prunes these subtrees upfront.
+_ADOPTION_PRUNE_DIRS: frozenset[str] = frozenset(
+    (
+        ".git",
+        ".tox",
+        ".venv",
+        "venv",
+        "__pycache__",
+        "node_modules",
+        "build",
+        "dist",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".pytest_cache",
+        "stubs",
+    )
+)
+
+
+def _adopt_directory(
+    directory: str, markers: dict[str, str], content_file_names: frozenset[str], content_targets: list[str]
+) -> None:
+    """Recursively crawls the input directory, renaming marker-matching entries and collecting content-scan targets.
+
+    This is the workhorse crawler used by adopt_project(). It enumerates each directory once via os.scandir and
+    prunes service directories (version control, virtual environments, build artifacts) that never contain template
+    placeholders, avoiding thousands of wasted entry evaluations on populated projects. File and directory renames
+    are carried out during the crawl (they have to run serially, as they change the paths the crawl descends into),
+    while content replacement candidates are only collected, so the caller can process them in parallel.
+
+    Args:
+        directory: The path to the directory to crawl.
+        markers: A shallow dictionary that contains markers to replace as keys and replacement values as values.
+        content_file_names: The names of the files whose contents should be scanned for markers.
+        content_targets: The list used to accumulate the paths of the files whose contents should be scanned. The
+            paths account for any renames carried out during the crawl.
+    """
+    # Materializes the entries upfront, as the loop below renames files and directories inside the scanned directory.
+    with os.scandir(directory) as scanned_entries:
+        entries: list[os.DirEntry[str]] = list(scanned_entries)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            # Skips service and build directories that never contain template placeholders.
+            if entry.name in _ADOPTION_PRUNE_DIRS:
+                continue
+
+            # If directory name matches one of the markers, renames the directory before descending into it.
+            dir_path: str = entry.path
+            if entry.name in markers:
+                new_dir_path = os.path.join(directory, markers[entry.name])
+                os.rename(dir_path, new_dir_path)
+                click.echo(f"Renamed directory: {dir_path} -> {new_dir_path}")
+                dir_path = new_dir_path
+
+            _adopt_directory(dir_path, markers, content_file_names, content_targets)
+
+        elif entry.is_file(follow_symlinks=False):
+            # Renames the file if its base name matches any of the placeholders.
+            file_path: str = entry.path
+            file_base, file_ext = os.path.splitext(entry.name)
+            if file_base in markers:
+                new_file_name = markers[file_base] + file_ext
+                new_file_path = os.path.join(directory, new_file_name)
+                os.rename(file_path, new_file_path)
+                click.echo(f"Renamed file: {file_path} -> {new_file_name}")
+                file_path = new_file_path
+
+            # If the file is inside the list of files to be content-checked, records it for marker replacement.
+            if entry.name in content_file_names:
+                content_targets.append(file_path)
+
+
 @cli.command()
 @click.option(
     "--library-name",
@@ -1036,19 +1375,21 @@ def adopt_project(library_name: str, project_name: str, author_name: str, email:
         "template_pure": env_name,  # The initial environment base-name used by pure-python projects
     }
 
-    # A tuple that stores the files whose content will be scanned for the presence of markers. All other files will not
+    # A set that stores the files whose content will be scanned for the presence of markers. All other files will not
     # be checked for content, but their names will be checked and replaced if they match any markers. Note, the files
-    # in this list can be anywhere inside the root project directory, the loop below will find and process them all.
-    file_names = (
-        "pyproject.toml",
-        "Doxyfile",
-        "CMakeLists.txt",
-        "tox.ini",
-        "conf.py",
-        "README.md",
-        "api.rst",
-        "welcome.rst",
-        "utilities_test.py",
+    # in this list can be anywhere inside the root project directory, the crawl below will find and process them all.
+    file_names = frozenset(
+        (
+            "pyproject.toml",
+            "Doxyfile",
+            "CMakeLists.txt",
+            "tox.ini",
+            "conf.py",
+            "README.md",
+            "api.rst",
+            "welcome.rst",
+            "utilities_test.py",
+        )
     )
 
     # Uses the input environment name to rename all environment files inside the 'envs' folder. This renames both file
@@ -1057,39 +1398,24 @@ def adopt_project(library_name: str, project_name: str, author_name: str, email:
     rename_all_envs(env_name)
 
     try:
-        # Loops over all files inside the script directory, which should be project root directory.
+        # Crawls all files inside the script directory, which should be project root directory. The crawl carries out
+        # all renames and collects the paths of the files whose contents should be scanned for markers.
+        content_targets: list[str] = []
+        _adopt_directory(project_dir, markers, file_names, content_targets)
+
+        # Content replacement is independent per file and dominated by file I/O, so the collected targets are
+        # processed through a thread pool to overlap the read/write latency across files.
+        # The marker alternation pattern is compiled once here and shared across all processed files.
         total_markers: int = 0  # Tracks the number of replaced markers.
-        for root, dirs, files in os.walk(project_dir):
-            for file in files:
-                # Gets the absolute path to each scanned file.
-                # noinspection PyTypeChecker
-                file_path: str = os.path.join(root, file)
-
-                # If the file is inside the list of files ot be content-checks, removes markers from file contents.
-                if file in file_names:
-                    total_markers += replace_markers_in_file(file_path, markers)
-
-                # Also processes file names in case they match any of the placeholders.
-                file_base, file_ext = os.path.splitext(file)
-                if file_base in markers:
-                    new_file_name = markers[file_base] + file_ext
-                    os.rename(file_path, os.path.join(root, new_file_name))
-                    click.echo(f"Renamed file: {file_path} -> {new_file_name}")
-
-            for directory in dirs:
-                # Gets the absolute path to each scanned directory.
-                # noinspection PyTypeChecker
-                dir_path: str = os.path.join(root, directory)
-
-                # If directory name matches one of the markers, renames the directory.
-                if directory in markers:
-                    new_dir_name = markers[directory]
-                    new_dir_path = os.path.join(root, new_dir_name)
-                    os.rename(dir_path, new_dir_path)
-                    click.echo(f"Renamed directory: {dir_path} -> {new_dir_path}")
-
-                    # Update the directory name in the dirs list to avoid potential issues with os.walk
-                    dirs[dirs.index(directory)] = new_dir_name
+        if content_targets:
+            # Deferred to command runtime so that commands that never use the pool do not pay the import cost.
+            from concurrent.futures import ThreadPoolExecutor
+
+            marker_pattern: re.Pattern[bytes] = _compile_marker_pattern(markers)
+            with ThreadPoolExecutor(max_workers=min(32, len(content_targets))) as executor:
+                total_markers = sum(
+                    executor.map(lambda path: replace_markers_in_file(path, markers, marker_pattern), content_targets)
+                )
 
         # Provides the final reminder
         message: str = format_message(
@@ -1,4 +1,5 @@
 import click
+import re
 from .utilities import format_message as format_message
 from os import PathLike
 from typing import AnyStr
@@ -8,7 +9,9 @@ def resolve_project_directory() -> str:
     python project.
 
     This function was introduced when automation moved to a separate package to decouple the behavior of this module's
-    functions from the location of the module.
+    functions from the location of the module. The working directory cannot change for the duration of a CLI
+    invocation, so the resolved (and verified) path is cached after the first call and helper functions that re-invoke
+    this function do not pay for repeated filesystem probes.
 
     Returns:
         The absolute path to the project root directory.
@@ -55,6 +58,9 @@ def delete_stubs(directory: str) -> None:
 def resolve_library_root() -> str:
     """Determines the relative path to the library root directory inside the 'src' directory of the source code.
 
+    Like resolve_project_directory(), this function produces a constant result for the duration of a CLI invocation,
+    so the resolved root is cached after the first call.
+
     This function is primarily used by the functions such as stub-generators that generate the necessary files in a
     temporary directory and then need to distribute them to source code directories. Since our c-extension and
     pure-python use a slightly different layout, this function allows using the same automation code for both project
@@ -92,6 +98,18 @@ def process_stubs() -> None:
         RuntimeError: If root (highest) directory cannot be resolved. If the function runs into an error
             processing stubs. If 'src' or 'stubs directories do not exist.
     """
+def process_stubs_pipeline() -> None:
+    """Sequentially resolves the 'py.typed' markers and distributes the generated stub files in a single process.
+
+    This command fuses the process_typed_markers and process_stubs steps, which tox otherwise runs as two separate
+    CLI processes. Running both in one process amortizes the interpreter startup, module imports, and the (cached)
+    project and library root resolution over both steps. The standalone commands remain available for pipelines that
+    need to run the steps individually.
+
+    Raises:
+        RuntimeError: If root (highest) directory cannot be resolved. If the function runs into an error
+            processing 'py.typed' markers or stubs. If 'src' or 'stubs' directories do not exist.
+    """
 def purge_stubs() -> None:
     """Removes all existing stub (.pyi) files from the 'src' directory.
 
@@ -151,16 +169,18 @@ def get_env_extension() -> str:
         BadParameter: If the host OS does not match any of the supported operating systems.
     """
 def get_conda_cmdlet() -> str:
-    """Determines whether mamba or conda can be accessed from this script by silently calling 'command --version'.
+    """Determines whether mamba or conda can be accessed from this script by looking the cmdlets up in the PATH.
 
     If mamba is available, it is used over conda. This process optimizes conda-related operations
-    (especially de novo environment creation) to use the fastest available engine.
+    (especially de novo environment creation) to use the fastest available engine. The lookup uses shutil.which()
+    instead of spawning '--version' subprocesses, which avoids paying the process startup cost for each probe, and the
+    result is cached for the lifetime of the process.
 
     Returns:
         The string-name of the cmdlet to use for all conda (or mamba) related commands.
 
     Raises:
-        RuntimeError: If neither conda nor mamba is accessible via subprocess call through the shell.
+        RuntimeError: If neither conda nor mamba is discoverable through the PATH.
     """
 def import_env() -> None:
     """Creates or updates an existing Conda environment based on the operating system-specific .yml file stored in
@@ -172,24 +192,22 @@ def import_env() -> None:
         RuntimeError: If there is no .yml file for the desired base-name and OS-extension combination in the 'envs'
             folder. If creation and update commands both fail for any reason. If 'envs' folder does not exist
     """
-def get_export_command(cmdlet_name: str, env_name: str, yml_path: str, spec_path: str) -> tuple[str, str]:
-    """Resolves the appropriate environment .yml and spec.txt export commands based on the platform OS version.
+def get_export_command(cmdlet_name: str, env_name: str) -> tuple[list[str], list[str]]:
+    """Resolves the environment .yml and spec.txt export commands as subprocess argument lists.
 
-    Supports the same set of OS versions as get_env_extension(). Primary reason for using separate commands is to
-    make sure they remove the prefix from the exported .yml file (primarily for privacy reasons).
+    The returned commands print the export data to stdout; the caller is responsible for capturing the output,
+    removing the environment prefix from the .yml data (primarily for privacy reasons) and writing the results to
+    the appropriate 'envs' folder files. Keeping the prefix removal in-process makes the commands identical across
+    all supported OS versions and lets the cmdlets run directly, without an intermediate shell to drive OS-specific
+    filtering and redirection pipelines.
 
     Args:
         cmdlet_name: The name of the execution cmdlet, valid options are 'conda' and 'mamba'.
         env_name: The base-name of the environment to export.
-        yml_path: The path to use for exporting the environment as a .yml file.
-        spec_path: The path to use for exporting the environment as a spec.txt file.
-
-    Returns: A tuple of two string-commands. The first command can be passed (via subprocess) to conda or mamba
-        to export the environment for the current project to 'envs' folder as a .yml file. THe second exports the
-        spec.txt list with revision history to the same folder.
 
-    Raises:
-        BadParameter: If the host OS does not match any of the supported operating systems.
+    Returns: A tuple of two argument-list commands. The first command can be passed (via subprocess) to conda or
+        mamba to print the .yml export data for the environment. The second prints the spec.txt list with revision
+        history.
     """
 def export_env(base_env: str) -> None:
     """Exports the OS-specific Conda environment as a .yml and as a spec.txt files.
@@ -275,7 +293,7 @@ def validate_env_name(_ctx: click.Context, _param: click.Parameter, value: str)
     """
 def rename_environments(new_name: str) -> None:
     """Iteratively renames environment files inside the 'envs' directory to use the input new_name as the base-name."""
-def replace_markers_in_file(file_path: str, markers: dict[str, str]) -> int:
+def replace_markers_in_file(file_path: str, markers: dict[str, str], pattern: re.Pattern[bytes] | None = None) -> int:
     """Replaces all occurrences of every marker in the input file contents with the appropriate replacement value.
 
     This method opens the file and scans through file contents searching for any of 'markers' dictionary keys. If keys
@@ -285,6 +303,8 @@ def replace_markers_in_file(file_path: str, markers: dict[str, str]) -> int:
     Args:
         file_path: The path to file in which to replace the markers.
         markers: A shallow dictionary that contains markers to replace as keys and replacement values as values.
+        pattern: The precompiled alternation pattern produced by _compile_marker_pattern() for the input markers.
+            When omitted, the pattern is compiled on the fly.
 
     Returns:
         The number of placeholder values modified during this method's runtime. Minimum number is 0 for no